@@ -50,6 +50,11 @@ def main():
         metavar="MULTIVERSE_ID",
         help="Generate page for a single card (proof of concept)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes used to render card pages (default: CPU count)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
@@ -70,6 +75,7 @@ def main():
         output_dir=args.output_dir,
         images_dir=args.images_dir,
         base_url=args.base_url,
+        workers=args.workers,
     )
 
     try:
@@ -121,11 +121,17 @@ def load_card_name_map(cardmap_file: Optional[Path] = None) -> Dict[str, int]:
 
     try:
         with open(cardmap_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except Exception as e:
         log.error("Error loading card mapping from %s: %s", cardmap_file, e)
         return {}
 
+    # Normalize keys once so lookups never need to lowercase them again
+    cardmap: Dict[str, int] = {}
+    for card_name, multiverse_id in data.items():
+        cardmap.setdefault(card_name.lower(), multiverse_id)
+    return cardmap
+
 
 def save_json_data(data: Dict, output_file: Path, description: str = "data") -> None:
     """Save data to JSON file with error handling and feedback.
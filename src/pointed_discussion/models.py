@@ -1,6 +1,7 @@
 """Data models for MTG card comments and metadata."""
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Optional
 
 
@@ -58,7 +59,7 @@ class Card:
 
     def __post_init__(self):
         """Sort comments by date."""
-        self.comments.sort(key=lambda c: c.datetime)
+        self.comments.sort(key=attrgetter("datetime"))
 
     @property
     def display_name(self) -> str:
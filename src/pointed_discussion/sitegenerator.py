@@ -1,14 +1,20 @@
 """Static site generator for Magic: The Gathering card comments archive."""
 
 import logging
+import os
 import re
 import shutil
 import string
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import fields
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2.environment import TemplateStream
 
 from pointed_discussion.data_utils import (
     iter_card_entries,
@@ -19,6 +25,130 @@ from pointed_discussion.models import Card, Comment
 
 log = logging.getLogger(__name__)
 
+# Card links look like:
+# <a href="/Pages/Card/Details.aspx?name=Progenitus" class="autoCard"
+# data:cardname="Progenitus">Progenitus</a>
+_CARD_LINK_PREFIX = '<a href="/Pages/Card/Details.aspx?name='
+_CARD_LINK_MIDDLE = '" class="autoCard" data:cardname="'
+_CARD_LINK_MARKER = "/Pages/Card/Details.aspx?name="
+
+# Pulls Comment fields out of a comment dict in constructor argument order
+_comment_values = itemgetter(*(field.name for field in fields(Comment)))
+
+# Buffer size for generated files, large enough to write most pages at once
+_BUFFER_SIZE = 1 << 20
+
+# Card image extensions, in order of preference
+_IMAGE_EXTENSIONS = (".webp", ".jpg", ".jpeg", ".png", ".gif")
+
+
+def _default_cache_dir() -> Path:
+    """Return the per-user directory for compiled template bytecode."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base_dir / "pointed_discussion" / "jinja"
+
+
+def _link_cards(text: str, cardmap: Dict[str, int]) -> str:
+    """Rewrite Gatherer card links in text using a plain str.find scanner.
+
+    Accepts exactly the links matched by the pattern
+    ``<a href="/Pages/Card/Details.aspx?name=([^"]+)" class="autoCard"
+    data:cardname="[^"]*">([^<]+)</a>``; anything else is left untouched.
+    """
+    prefix_len = len(_CARD_LINK_PREFIX)
+    middle_len = len(_CARD_LINK_MIDDLE)
+    parts = []
+    i = 0
+    start = text.find(_CARD_LINK_PREFIX)
+
+    while start != -1:
+        name_start = start + prefix_len
+        name_end = text.find('"', name_start)
+        if name_end > name_start and text.startswith(_CARD_LINK_MIDDLE, name_end):
+            data_end = text.find('"', name_end + middle_len)
+            if data_end != -1 and text.startswith('">', data_end):
+                link_start = data_end + 2
+                link_end = text.find("<", link_start)
+                if link_end > link_start and text.startswith("</a>", link_end):
+                    card_name = text[name_start:name_end]
+                    if "%20" in card_name:
+                        card_name = card_name.replace("%20", " ")  # URL decode
+                    link_text = text[link_start:link_end]
+                    target_multiverse_id = cardmap.get(card_name.lower())
+
+                    parts.append(text[i:start])
+                    if target_multiverse_id is not None:
+                        parts.append(
+                            f'<a href="../cards/{target_multiverse_id}.html" class="card-link">{link_text}</a>'  # noqa: E501
+                        )
+                    else:
+                        # If we don't have the card, just keep the text without a link
+                        parts.append(link_text)
+
+                    i = link_end + 4
+                    start = text.find(_CARD_LINK_PREFIX, i)
+                    continue
+
+        # Not a well-formed card link; keep scanning after this position
+        start = text.find(_CARD_LINK_PREFIX, start + 1)
+
+    if not parts:
+        return text
+
+    parts.append(text[i:])
+    return "".join(parts)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content.
+
+    Leaving unchanged files alone keeps their modification times stable, so
+    incremental rebuilds and deploy tooling only see pages that changed.
+    """
+    # Compare raw bytes: text mode would translate any "\r" in comments
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    with open(path, "wb", buffering=_BUFFER_SIZE) as f:
+        f.write(data)
+    return True
+
+
+def _dump_stream(path: Path, stream: TemplateStream) -> None:
+    """Stream rendered template output into path, replacing it only on success.
+
+    Output goes to a temporary file in the same directory first, so a template
+    error partway through never leaves a half-written page behind.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+            stream.dump(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Generator shared by card page worker processes, set by _init_card_worker
+_worker_generator: Optional["SiteGenerator"] = None
+
+
+def _init_card_worker(generator: "SiteGenerator") -> None:
+    """Install the generator used by this card page worker process."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_card_page(multiverse_id: int) -> Tuple[Optional[str], Optional[str]]:
+    """Generate a card page in a worker process."""
+    return _worker_generator.try_generate_card_page(multiverse_id)
+
 
 class SiteGenerator:
     """Generates static site from MTG card comment data."""
@@ -29,20 +159,24 @@ class SiteGenerator:
         output_dir: Path,
         images_dir: Optional[Path] = None,
         base_url: str = "",
+        workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize the SiteGenerator with directories and options."""
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
         self.images_dir = Path(images_dir) if images_dir else Path("images")
         self.base_url = base_url.rstrip("/")  # Remove trailing slash if present
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.cards: Dict[int, Card] = {}
         self.scryfall_data: Dict[int, Dict] = {}
         self.cardmap: Dict[str, int] = {}
         self.cards_by_oracle_id: Dict[str, list[int]] = defaultdict(list)
+        self.image_index: Optional[Dict[int, str]] = None
 
         # Setup Jinja2 environment
-        template_dir = Path(__file__).parent / "templates"
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        self._setup_templates()
 
         # Load cached Scryfall data if available
         self.scryfall_data = load_scryfall_data()
@@ -50,44 +184,73 @@ class SiteGenerator:
         # Load card name mapping if available
         self.cardmap = load_card_name_map()
 
-    def process_card_links(self, text: str) -> str:
-        """Replace card links in text with local links to card pages."""
-        # Pattern to match card links like:
-        # <a href="/Pages/Card/Details.aspx?name=Progenitus" class="autoCard"
-        # data:cardname="Progenitus">Progenitus</a>
-        pattern = r'<a href="/Pages/Card/Details\.aspx\?name=([^"]+)" class="autoCard" data:cardname="[^"]*">([^<]+)</a>'  # noqa: E501
+    def __getstate__(self) -> Dict:
+        """Drop the Jinja2 environment when sending the generator to workers."""
+        state = self.__dict__.copy()
+        for key in (
+            "jinja_env",
+            "card_template",
+            "combined_template",
+            "search_template",
+        ):
+            del state[key]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore the generator and rebuild its Jinja2 environment."""
+        self.__dict__.update(state)
+        self._setup_templates()
+
+    def _setup_templates(self) -> None:
+        """Create the Jinja2 environment and load page templates."""
+        template_dir = Path(__file__).parent / "templates"
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=self._create_bytecode_cache(),
+            auto_reload=False,
+        )
+        self.card_template = self.jinja_env.get_template("card.html")
+        self.combined_template = self.jinja_env.get_template("card_combined.html")
+        self.search_template = self.jinja_env.get_template("search.html")
 
-        def replace_link(match):
-            card_name = match.group(1).replace("%20", " ")  # URL decode spaces
-            link_text = match.group(2)
+    def _create_bytecode_cache(self) -> Optional[FileSystemBytecodeCache]:
+        """Create a persistent cache for compiled template bytecode."""
+        try:
+            cache_dir = self.cache_dir or _default_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except (OSError, RuntimeError) as e:
+            # RuntimeError: Path.home() could not resolve a home directory
+            log.debug("Template bytecode cache disabled: %s", e)
+            return None
 
-            target_multiverse_id = self.cardmap.get(str(card_name).lower())
+        return FileSystemBytecodeCache(str(cache_dir))
 
-            if target_multiverse_id:
-                return f'<a href="../cards/{target_multiverse_id}.html" class="card-link">{link_text}</a>'  # noqa: E501
-            else:
-                # If we don't have the card, just return the text without a link
-                return link_text
+    def process_card_links(self, text: str) -> str:
+        """Replace card links in text with local links to card pages."""
+        # Most comments contain no card links; skip scanning them
+        if _CARD_LINK_MARKER not in text:
+            return text
 
-        return re.sub(pattern, replace_link, text)
+        return _link_cards(text, self.cardmap)
 
     def load_card_data(self) -> None:
         """Load all card data from JSON files using shared utilities."""
         log.info("Loading card data...")
 
+        # Cards whose comments were merged from several files need re-sorting
+        merged_ids = set()
+
         # Use shared utility to iterate over all card entries
         for multiverse_id, card_name, comments_data in iter_card_entries(self.data_dir):
-            # Convert comment data to Comment objects
-            comments = []
-            for comment_data in comments_data:
-                comment = Comment(**comment_data)
-                comments.append(comment)
+            # Convert comment data to Comment objects, passing fields
+            # positionally since keyword unpacking is slower at this volume
+            comments = [Comment(*_comment_values(data)) for data in comments_data]
 
             # Create or update card
             if multiverse_id in self.cards:
                 # Merge comments if card already exists
                 self.cards[multiverse_id].comments.extend(comments)
-                self.cards[multiverse_id].comments.sort(key=lambda c: c.datetime)
+                merged_ids.add(multiverse_id)
             else:
                 card = Card(
                     multiverse_id=multiverse_id,
@@ -107,6 +270,11 @@ class SiteGenerator:
 
                 self.cards[multiverse_id] = card
 
+        # Sort merged comments once, after every file has been loaded
+        by_datetime = attrgetter("datetime")
+        for multiverse_id in merged_ids:
+            self.cards[multiverse_id].comments.sort(key=by_datetime)
+
         # Process card links in all comments after all cards are loaded
         self.process_all_card_links()
 
@@ -130,11 +298,11 @@ class SiteGenerator:
                 self.cards_by_oracle_id[card.oracle_id].append(multiverse_id)
 
         # Sort printings by release date within each group
-        for oracle_id, multiverse_ids in self.cards_by_oracle_id.items():
-            self.cards_by_oracle_id[oracle_id] = sorted(
-                multiverse_ids,
-                key=lambda mid: self.cards[mid].released_at or "9999-99-99",
-            )
+        released = {
+            mid: card.released_at or "9999-99-99" for mid, card in self.cards.items()
+        }
+        for multiverse_ids in self.cards_by_oracle_id.values():
+            multiverse_ids.sort(key=released.__getitem__)
 
         log.info(
             "Grouped %d cards into %d unique cards",
@@ -155,33 +323,60 @@ class SiteGenerator:
 
         return [self.cards[mid] for mid in other_ids]
 
+    def load_image_index(self) -> None:
+        """Index available card images by multiverse ID with one directory scan."""
+        self.image_index = {}
+        if not self.images_dir.is_dir():
+            return
+
+        best_rank: Dict[int, int] = {}
+        for entry in os.scandir(self.images_dir):
+            stem, ext = os.path.splitext(entry.name)
+            # Only ASCII digit stems are IDs; "²".isdigit() is True but int()
+            # rejects it, so one stray file would otherwise abort the build
+            if ext not in _IMAGE_EXTENSIONS or not (
+                stem.isascii() and stem.isdecimal()
+            ):
+                continue
+
+            # Keep the preferred format when an image exists in several
+            multiverse_id = int(stem)
+            rank = _IMAGE_EXTENSIONS.index(ext)
+            if rank < best_rank.get(multiverse_id, len(_IMAGE_EXTENSIONS)):
+                best_rank[multiverse_id] = rank
+                self.image_index[multiverse_id] = entry.path
+
     def find_card_image(self, multiverse_id: int) -> Optional[str]:
         """Find existing card image in the images directory."""
-        # Check for WebP format first
-        webp_path = self.images_dir / f"{multiverse_id}.webp"
-        if webp_path.exists():
-            return str(webp_path)
+        if self.image_index is None:
+            self.load_image_index()
 
-        # Check for common image formats
-        for ext in [".jpg", ".jpeg", ".png", ".gif"]:
-            img_path = self.images_dir / f"{multiverse_id}{ext}"
-            if img_path.exists():
-                return str(img_path)
-
-        return None
+        return self.image_index.get(multiverse_id)
 
     def copy_card_image(self, image_path: str, multiverse_id: int) -> Optional[str]:
         """Copy card image from images directory to output directory."""
         output_images_dir = self.output_dir / "images"
-        output_images_dir.mkdir(exist_ok=True)
 
         try:
             source_path = Path(image_path)
             filename = source_path.name
             output_path = output_images_dir / filename
 
-            # Copy the image file
-            shutil.copy2(source_path, output_path)
+            if output_path.exists():
+                # A previous run may already have linked this exact file
+                if os.path.samefile(source_path, output_path):
+                    return f"images/{filename}"
+
+                # Remove a stale output rather than writing into it, since it
+                # may share its inode with another file through a hard link
+                output_path.unlink()
+
+            # Hard link the image when possible so no bytes are copied, falling
+            # back to copyfile (without copy2's metadata calls) across devices
+            try:
+                os.link(source_path, output_path)
+            except OSError:
+                shutil.copyfile(source_path, output_path)
 
             return f"images/{filename}"
 
@@ -212,22 +407,68 @@ class SiteGenerator:
         if card.oracle_id and len(other_printings) > 0:
             combined_page_link = f"combined/{card.oracle_id}.html"
 
-        # Create cards directory
-        cards_dir = self.output_dir / "cards"
-        cards_dir.mkdir(exist_ok=True)
-
         # Render template
-        template = self.jinja_env.get_template("card.html")
-        html_content = template.render(
+        html_content = self.card_template.render(
             card=card,
             other_printings=other_printings,
             combined_page_link=combined_page_link,
         )
 
-        # Write HTML file
-        card_file = cards_dir / f"{card.multiverse_id}.html"
-        with open(card_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # Write HTML file, skipping pages unchanged since the last build
+        card_file = self.output_dir / "cards" / f"{card.multiverse_id}.html"
+        _write_if_changed(card_file, html_content)
+
+    def try_generate_card_page(
+        self, multiverse_id: int
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Generate a card page, returning its image URL and any error message."""
+        card = self.cards[multiverse_id]
+        try:
+            self.generate_card_page(card)
+        except Exception as e:
+            return card.image_url, str(e)
+        return card.image_url, None
+
+    def generate_card_pages(self) -> None:
+        """Generate pages for all cards, in parallel when workers allow it."""
+        multiverse_ids = list(self.cards)
+        total = len(multiverse_ids)
+
+        # Scan the images directory once here rather than in every worker
+        if self.image_index is None:
+            self.load_image_index()
+
+        # Card pages are independent, so render them across worker processes.
+        # Workers send back each card's image URL since they only update copies.
+        if self.workers > 1 and total > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_card_worker,
+                initargs=(self,),
+            )
+        else:
+            executor = None
+
+        with executor or nullcontext():
+            if executor:
+                results = executor.map(_render_card_page, multiverse_ids, chunksize=64)
+            else:
+                results = map(self.try_generate_card_page, multiverse_ids)
+
+            for i, (multiverse_id, (image_url, error)) in enumerate(
+                zip(multiverse_ids, results), 1
+            ):
+                card = self.cards[multiverse_id]
+                card.image_url = image_url
+                if error:
+                    log.error(
+                        "Error generating page for %s (ID: %d): %s",
+                        card.name,
+                        multiverse_id,
+                        error,
+                    )
+                elif i % 10 == 0 or i == total:
+                    log.info("Generated %d/%d cards...", i, total)
 
     def generate_combined_page(self, oracle_id: str) -> None:
         """Generate combined page showing all comments across all printings."""
@@ -252,13 +493,8 @@ class SiteGenerator:
             total_comments,
         )
 
-        # Create combined directory
-        combined_dir = self.output_dir / "cards" / "combined"
-        combined_dir.mkdir(exist_ok=True, parents=True)
-
         # Render template
-        template = self.jinja_env.get_template("card_combined.html")
-        html_content = template.render(
+        html_content = self.combined_template.render(
             card_name=card_name,
             printings=printings,
             total_comments=total_comments,
@@ -266,14 +502,21 @@ class SiteGenerator:
         )
 
         # Write HTML file
-        combined_file = combined_dir / f"{oracle_id}.html"
-        with open(combined_file, "w", encoding="utf-8") as f:
+        combined_file = self.output_dir / "cards" / "combined" / f"{oracle_id}.html"
+        with open(combined_file, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
             f.write(html_content)
 
+    def create_output_dirs(self) -> None:
+        """Create the output directory tree used by the page generators."""
+        self.output_dir.mkdir(exist_ok=True)
+        (self.output_dir / "cards").mkdir(exist_ok=True)
+        (self.output_dir / "cards" / "combined").mkdir(exist_ok=True)
+        (self.output_dir / "images").mkdir(exist_ok=True)
+
     def generate_single_card(self, multiverse_id: int) -> None:
         """Generate site for a single card (proof of concept)."""
-        # Ensure output directory exists
-        self.output_dir.mkdir(exist_ok=True)
+        # Ensure output directories exist
+        self.create_output_dirs()
 
         # Load only the data we need for this card
         self.load_card_data()
@@ -297,11 +540,18 @@ class SiteGenerator:
 
     def generate_all_cards(self) -> None:
         """Generate complete static site for all cards."""
-        # Ensure output directory exists
-        self.output_dir.mkdir(exist_ok=True)
+        # Ensure output directories exist
+        self.create_output_dirs()
 
-        # Load all card data
-        self.load_card_data()
+        # Copy static files in the background while card data loads. The copy
+        # is I/O bound and must finish before card page workers are forked.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            static_copy = executor.submit(self.copy_static_files)
+
+            # Load all card data
+            self.load_card_data()
+
+        static_copy.result()
 
         if not self.cards:
             log.info("No cards found in data directory.")
@@ -310,18 +560,7 @@ class SiteGenerator:
         log.info("Generating pages for %d cards...", len(self.cards))
 
         # Generate individual card pages
-        for i, (multiverse_id, card) in enumerate(self.cards.items(), 1):
-            try:
-                self.generate_card_page(card)
-                if i % 10 == 0 or i == len(self.cards):
-                    log.info("Generated %d/%d cards...", i, len(self.cards))
-            except Exception as e:
-                log.error(
-                    "Error generating page for %s (ID: %d): %s",
-                    card.name,
-                    multiverse_id,
-                    e,
-                )
+        self.generate_card_pages()
 
         # Generate combined pages for all unique cards
         if self.cards_by_oracle_id:
@@ -354,9 +593,6 @@ class SiteGenerator:
         # Generate redirects file for friendly URLs
         self.generate_redirects()
 
-        # Copy static files
-        self.copy_static_files()
-
         log.info("Site generation complete!")
         log.info("Output directory: %s", self.output_dir)
         log.info("Main page: %s", self.output_dir / "index.html")
@@ -364,46 +600,47 @@ class SiteGenerator:
 
     def generate_search_page(self) -> None:
         """Generate the main search/index page with full functionality."""
-        # Helper function to get all comments for a card across printings
-        def get_all_comments(oracle_id):
-            all_comments = []
-            for mid in self.cards_by_oracle_id.get(oracle_id, []):
-                all_comments.extend(self.cards[mid].comments)
-            return all_comments
-
-        # Helper function to calculate average rating
-        def get_avg_rating(comments):
-            if not comments:
-                return 0
-            rated_comments = [c for c in comments if c.vote_count > 0]
-            if not rated_comments:
-                return 0
-            return sum(c.star_rating for c in rated_comments) / len(rated_comments)
-
         # Build unique card list (one entry per oracle_id)
         unique_cards = []
         for oracle_id, multiverse_ids in self.cards_by_oracle_id.items():
             # Use the first (earliest) printing as representative
             representative_card = self.cards[multiverse_ids[0]]
-            all_comments = get_all_comments(oracle_id)
+
+            # Count comments and average ratings across all printings in one pass
+            total_comments = 0
+            rated_count = 0
+            rating_sum = 0.0
+            for mid in multiverse_ids:
+                comments = self.cards[mid].comments
+                total_comments += len(comments)
+                for comment in comments:
+                    if comment.vote_count > 0:
+                        rated_count += 1
+                        rating_sum += comment.star_rating
 
             unique_cards.append({
                 "name": representative_card.name,
+                "name_lower": representative_card.name.lower(),
                 "oracle_id": oracle_id,
-                "total_comments": len(all_comments),
-                "avg_rating": get_avg_rating(all_comments),
+                "total_comments": total_comments,
+                "avg_rating": rating_sum / rated_count if rated_count else 0,
                 "printings_count": len(multiverse_ids),
             })
 
-        # Group unique cards alphabetically
-        cards_by_letter = defaultdict(list)
-        for card in sorted(unique_cards, key=lambda c: c["name"].lower()):
-            first_char = card["name"][0].upper()
+        # Group unique cards alphabetically into "0-9" and A-Z buckets; other
+        # alphabetic initials (e.g. "Æ") get their own bucket after Z
+        cards_by_letter = {"0-9": []}
+        cards_by_letter.update((letter, []) for letter in string.ascii_uppercase)
+        unique_cards.sort(key=itemgetter("name_lower"))
+        for card in unique_cards:
+            first_char = card["name"][0]
 
-            if first_char.isdigit():
-                cards_by_letter["0-9"].append(card)
-            elif first_char.isalpha():
+            if "A" <= first_char <= "Z":
                 cards_by_letter[first_char].append(card)
+            elif "a" <= first_char <= "z":
+                cards_by_letter[first_char.upper()].append(card)
+            elif first_char.upper().isalpha():
+                cards_by_letter.setdefault(first_char.upper(), []).append(card)
             else:
                 cards_by_letter["0-9"].append(card)
 
@@ -412,18 +649,16 @@ class SiteGenerator:
 
         # Prepare template data
         template_data = {
-            "cards_by_letter": dict(cards_by_letter),
+            "cards_by_letter": {
+                letter: cards for letter, cards in cards_by_letter.items() if cards
+            },
             "alphabet": alphabet,
         }
 
-        # Render template
-        template = self.jinja_env.get_template("search.html")
-        html_content = template.render(**template_data)
-
-        # Write HTML file
+        # Stream the template into the HTML file: the index lists every card,
+        # so rendering it to one string first would hold the whole page
         index_file = self.output_dir / "index.html"
-        with open(index_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        _dump_stream(index_file, self.search_template.stream(**template_data))
 
     @staticmethod
     def slugify_card_name(name: str) -> str:
@@ -480,7 +715,7 @@ class SiteGenerator:
 
         # Write _redirects file
         redirects_file = self.output_dir / "_redirects"
-        with open(redirects_file, "w", encoding="utf-8") as f:
+        with open(redirects_file, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
             f.write("\n".join(redirects))
 
         log.info("Generated %d redirects", len(redirects))
@@ -490,58 +725,34 @@ class SiteGenerator:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        sitemap_lines = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-        ]
+        base = f"{self.base_url}/" if self.base_url else ""
 
-        # Add main page
-        main_url = f"{self.base_url}/index.html" if self.base_url else "index.html"
-        sitemap_lines.extend(
-            [
-                "  <url>",
-                f"    <loc>{main_url}</loc>",
-                "    <priority>1.0</priority>",
-                "  </url>",
-            ]
-        )
-
-        # Add all card pages
-        for multiverse_id, card in sorted(self.cards.items()):
-            if self.base_url:
-                card_url = f"{self.base_url}/cards/{multiverse_id}.html"
-            else:
-                card_url = f"cards/{multiverse_id}.html"
-            sitemap_lines.extend(
-                [
-                    "  <url>",
-                    f"    <loc>{card_url}</loc>",
-                    "    <priority>0.8</priority>",
-                    "  </url>",
-                ]
-            )
-
-        # Add combined pages (for cards with multiple printings)
-        for oracle_id, multiverse_ids in sorted(self.cards_by_oracle_id.items()):
-            if len(multiverse_ids) > 1:
-                if self.base_url:
-                    combined_url = f"{self.base_url}/cards/combined/{oracle_id}.html"
-                else:
-                    combined_url = f"cards/combined/{oracle_id}.html"
-                sitemap_lines.extend(
-                    [
-                        "  <url>",
-                        f"    <loc>{combined_url}</loc>",
-                        "    <priority>0.9</priority>",
-                        "  </url>",
-                    ]
+        # Write entries as they are produced instead of building the whole file
+        sitemap_file = self.output_dir / "sitemap.xml"
+        with open(sitemap_file, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+            write = f.write
+            write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+
+            # Add main page
+            write(f"  <url><loc>{base}index.html</loc><priority>1.0</priority></url>\n")
+
+            # Add all card pages
+            for multiverse_id in sorted(self.cards):
+                write(
+                    f"  <url><loc>{base}cards/{multiverse_id}.html</loc>"
+                    "<priority>0.8</priority></url>\n"
                 )
 
-        sitemap_lines.append("</urlset>")
+            # Add combined pages (for cards with multiple printings)
+            for oracle_id, multiverse_ids in sorted(self.cards_by_oracle_id.items()):
+                if len(multiverse_ids) > 1:
+                    write(
+                        f"  <url><loc>{base}cards/combined/{oracle_id}.html</loc>"
+                        "<priority>0.9</priority></url>\n"
+                    )
 
-        sitemap_file = self.output_dir / "sitemap.xml"
-        with open(sitemap_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(sitemap_lines))
+            write("</urlset>")
 
     def copy_static_files(self) -> None:
         """Copy CSS and other static files."""
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for the shared data utilities."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from pointed_discussion.data_utils import load_card_name_map
+
+
+class TestLoadCardNameMap(unittest.TestCase):
+    """Test loading the card name mapping."""
+
+    def test_keys_are_lowercased_and_first_entry_wins(self):
+        """Test mixed-case keys are lowercased, keeping the first on collision."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cardmap_file = Path(temp_dir) / "cardmap.json"
+            with open(cardmap_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "Control Magic": 100,
+                        "control magic": 200,
+                        "CONTROL MAGIC": 300,
+                        "arena": 97042,
+                    },
+                    f,
+                )
+
+            cardmap = load_card_name_map(cardmap_file)
+
+        self.assertEqual(cardmap, {"control magic": 100, "arena": 97042})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,13 @@
 """Tests for the site generator."""
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from pointed_discussion.sitegenerator import Comment, SiteGenerator
+from pointed_discussion.sitegenerator import Card, Comment, SiteGenerator
 
 
 class TestComment(unittest.TestCase):
@@ -99,6 +101,7 @@ class TestSiteGenerator(unittest.TestCase):
         self.temp_dir = tempfile.mkdtemp()
         self.data_dir = Path(self.temp_dir) / "data"
         self.output_dir = Path(self.temp_dir) / "output"
+        self.cache_dir = Path(self.temp_dir) / "cache"
 
         # Create test data structure
         self.data_dir.mkdir(parents=True)
@@ -128,7 +131,9 @@ class TestSiteGenerator(unittest.TestCase):
 
     def test_load_card_data(self):
         """Test loading card data from JSON files."""
-        generator = SiteGenerator(self.data_dir, self.output_dir)
+        generator = SiteGenerator(
+            self.data_dir, self.output_dir, cache_dir=self.cache_dir
+        )
         generator.load_card_data()
 
         self.assertIn(97042, generator.cards)
@@ -138,11 +143,177 @@ class TestSiteGenerator(unittest.TestCase):
         self.assertEqual(card.comments[0].author, "TestUser")
         self.assertEqual(card.comments[0].star_rating, 4.0)
 
+    def test_template_bytecode_cache_dir(self):
+        """Test compiled templates are cached in the configured directory."""
+        SiteGenerator(self.data_dir, self.output_dir, cache_dir=self.cache_dir)
+        self.assertTrue(any(self.cache_dir.iterdir()))
+
+    def test_process_card_links(self):
+        """Test Gatherer card links are rewritten to local card pages."""
+        generator = SiteGenerator(
+            self.data_dir, self.output_dir, cache_dir=self.cache_dir
+        )
+        generator.cardmap = {"control magic": 100}
+
+        text = (
+            'Better than <a href="/Pages/Card/Details.aspx?name=Control%20Magic" '
+            'class="autoCard" data:cardname="Control Magic">Control Magic</a> '
+            'and <a href="/Pages/Card/Details.aspx?name=Unknown" '
+            'class="autoCard" data:cardname="Unknown">Unknown</a>.'
+        )
+        self.assertEqual(
+            generator.process_card_links(text),
+            'Better than <a href="../cards/100.html" class="card-link">'
+            "Control Magic</a> and Unknown.",
+        )
+
+        # Text without card links is returned unchanged
+        self.assertEqual(generator.process_card_links("No links"), "No links")
+
+    def test_generate_all_cards_with_workers(self):
+        """Test card pages rendered in worker processes update the parent."""
+        test_file = self.data_dir / "199x" / "1993" / "1993-01-01 PRM.json"
+        test_data = json.loads(test_file.read_text())
+        test_data["100: Control Magic"] = test_data["97042: Arena"]
+        test_file.write_text(json.dumps(test_data))
+
+        images_dir = Path(self.temp_dir) / "images"
+        images_dir.mkdir()
+        (images_dir / "97042.jpg").write_bytes(b"image")
+
+        generator = SiteGenerator(
+            self.data_dir,
+            self.output_dir,
+            images_dir=images_dir,
+            workers=2,
+            cache_dir=self.cache_dir,
+        )
+        generator.generate_all_cards()
+
+        card_file = self.output_dir / "cards" / "97042.html"
+        self.assertIn("This is a test comment.", card_file.read_text())
+        self.assertTrue((self.output_dir / "cards" / "100.html").exists())
+        self.assertTrue((self.output_dir / "images" / "97042.jpg").exists())
+        self.assertEqual(generator.cards[97042].image_url, "images/97042.jpg")
+
+    def test_find_card_image(self):
+        """Test image lookup prefers WebP and ignores non-ID file names."""
+        images_dir = Path(self.temp_dir) / "images"
+        images_dir.mkdir()
+        for name in ("97042.jpg", "97042.webp", "².jpg", "notes.png"):
+            (images_dir / name).write_bytes(b"image")
+
+        generator = SiteGenerator(
+            self.data_dir,
+            self.output_dir,
+            images_dir=images_dir,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(
+            generator.find_card_image(97042), str(images_dir / "97042.webp")
+        )
+        self.assertIsNone(generator.find_card_image(2))
+
+    def test_copy_card_image(self):
+        """Test images are linked into the output and stale copies replaced."""
+        images_dir = Path(self.temp_dir) / "images"
+        images_dir.mkdir()
+        source = images_dir / "97042.jpg"
+        source.write_bytes(b"new image")
+
+        generator = SiteGenerator(
+            self.data_dir,
+            self.output_dir,
+            images_dir=images_dir,
+            cache_dir=self.cache_dir,
+        )
+        generator.create_output_dirs()
+        output = self.output_dir / "images" / "97042.jpg"
+
+        # Fresh copy, then a rerun against the already linked file
+        for _ in range(2):
+            self.assertEqual(
+                generator.copy_card_image(str(source), 97042), "images/97042.jpg"
+            )
+            self.assertTrue(os.path.samefile(source, output))
+
+        # A stale output that is hard linked to another file is replaced
+        # without modifying the file it shares an inode with
+        output.unlink()
+        other = images_dir / "other.jpg"
+        other.write_bytes(b"old image")
+        os.link(other, output)
+
+        generator.copy_card_image(str(source), 97042)
+        self.assertEqual(output.read_bytes(), b"new image")
+        self.assertEqual(other.read_bytes(), b"old image")
+
+        # When hard links are unavailable the image is copied instead
+        output.unlink()
+        with mock.patch("os.link", side_effect=OSError("cross-device link")):
+            generator.copy_card_image(str(source), 97042)
+        self.assertEqual(output.read_bytes(), b"new image")
+        self.assertFalse(os.path.samefile(source, output))
+
+    def test_generate_card_page_skips_unchanged_pages(self):
+        """Test regenerating an unchanged card page leaves the file untouched."""
+        generator = SiteGenerator(
+            self.data_dir, self.output_dir, cache_dir=self.cache_dir
+        )
+        generator.create_output_dirs()
+        generator.load_card_data()
+        card = generator.cards[97042]
+
+        card_file = self.output_dir / "cards" / "97042.html"
+        generator.generate_card_page(card)
+        os.utime(card_file, ns=(0, 0))
+
+        generator.generate_card_page(card)
+        self.assertEqual(card_file.stat().st_mtime_ns, 0)
+
+        card.comments[0].text_parsed = "An edited comment."
+        generator.generate_card_page(card)
+        self.assertNotEqual(card_file.stat().st_mtime_ns, 0)
+        self.assertIn("An edited comment.", card_file.read_text())
+
+        # Comments with carriage returns must round-trip byte for byte
+        card.comments[0].text_parsed = "First line\r\nSecond line\rThird line"
+        generator.generate_card_page(card)
+        self.assertIn(b"First line\r\nSecond line\rThird", card_file.read_bytes())
+        os.utime(card_file, ns=(0, 0))
+
+        generator.generate_card_page(card)
+        self.assertEqual(card_file.stat().st_mtime_ns, 0)
+
+    def test_search_page_render_error_keeps_existing_page(self):
+        """Test a failed render leaves the previous page in place."""
+        generator = SiteGenerator(
+            self.data_dir, self.output_dir, cache_dir=self.cache_dir
+        )
+        generator.create_output_dirs()
+        generator.load_card_data()
+
+        index_file = self.output_dir / "index.html"
+        index_file.write_text("previous page", encoding="utf-8")
+        generator.search_template = generator.jinja_env.from_string(
+            "partial output {{ 1 // 0 }}"
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            generator.generate_search_page()
+
+        self.assertEqual(index_file.read_text(encoding="utf-8"), "previous page")
+        # No temporary files are left behind either
+        self.assertEqual(
+            sorted(p.name for p in self.output_dir.iterdir()),
+            ["cards", "images", "index.html"],
+        )
+
     def test_sitemap_generation_with_base_url(self):
         """Test sitemap generation with base URL produces fully qualified URLs."""
         base_url = "https://gatherer.mtg.li"
         generator = SiteGenerator(
-            self.data_dir, self.output_dir, base_url=base_url
+            self.data_dir, self.output_dir, base_url=base_url, cache_dir=self.cache_dir
         )
         generator.load_card_data()
         generator.generate_sitemap()
@@ -159,9 +330,35 @@ class TestSiteGenerator(unittest.TestCase):
         self.assertIn(f"{base_url}/index.html", sitemap_content)
         self.assertIn(f"{base_url}/cards/97042.html", sitemap_content)
 
+    def test_sitemap_and_redirects_without_load_card_data(self):
+        """Test sitemap and redirects reflect cards added outside loading."""
+        generator = SiteGenerator(
+            self.data_dir, self.output_dir, cache_dir=self.cache_dir
+        )
+        for multiverse_id in (2, 1):
+            generator.cards[multiverse_id] = Card(
+                multiverse_id=multiverse_id, name="Wear // Tear", comments=[]
+            )
+            generator.cards_by_oracle_id["oracle"].append(multiverse_id)
+
+        generator.generate_sitemap()
+        generator.generate_redirects()
+
+        sitemap_content = (self.output_dir / "sitemap.xml").read_text()
+        self.assertLess(
+            sitemap_content.index("cards/1.html"), sitemap_content.index("cards/2.html")
+        )
+        self.assertIn("cards/combined/oracle.html", sitemap_content)
+        self.assertEqual(
+            (self.output_dir / "_redirects").read_text(),
+            "/cards/combined/wear-tear /cards/combined/oracle.html 301",
+        )
+
     def test_sitemap_generation_without_base_url(self):
         """Test sitemap generation without base URL produces relative URLs."""
-        generator = SiteGenerator(self.data_dir, self.output_dir)
+        generator = SiteGenerator(
+            self.data_dir, self.output_dir, cache_dir=self.cache_dir
+        )
         generator.load_card_data()
         generator.generate_sitemap()
 